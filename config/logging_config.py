@@ -1,19 +1,65 @@
 """Logging configuration for the WhisprMate application."""
 
+import atexit
 import logging
 import logging.config
 import os
-from datetime import datetime
+import queue
+import threading
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
 
+# Listener thread that owns the file handlers; stopped (and flushed) at exit
+_queue_listener = None
+_flush_timer = None
+
+# How often the buffered main-log handler is flushed to disk, bounding the
+# window of records lost on a hard crash
+_FLUSH_INTERVAL_SECONDS = 5.0
+
+
+def _schedule_flush(mem_handler: MemoryHandler) -> None:
+    """Flush the buffered handler and reschedule the next flush."""
+    global _flush_timer
+    mem_handler.flush()
+    _flush_timer = threading.Timer(_FLUSH_INTERVAL_SECONDS, _schedule_flush, args=(mem_handler,))
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def _stop_queue_listener() -> None:
+    """Stop the queue listener, flushing buffered records (idempotent)."""
+    global _queue_listener, _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    if _queue_listener is not None:
+        handlers = _queue_listener.handlers
+        _queue_listener.stop()
+        for handler in handlers:
+            handler.close()
+            if isinstance(handler, MemoryHandler) and handler.target is not None:
+                handler.target.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(log_level: str = "INFO", log_file: str = None) -> None:
     """Set up logging configuration for the application.
 
+    File output is routed through a QueueHandler backed by a QueueListener
+    thread, so log calls on the Streamlit request thread only enqueue a
+    record instead of paying a write() syscall per emit.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path. If None, uses default location.
     """
+    global _queue_listener
+
     # Create logs directory if it doesn't exist
     logs_dir = Path("logs")
     try:
@@ -26,10 +72,11 @@ def setup_logging(log_level: str = "INFO", log_file: str = None) -> None:
 
     # Default log file with timestamp
     if log_file is None and logs_writable:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         log_file = logs_dir / f"whisprmate_{timestamp}.log"
 
-    # Logging configuration
+    # Logging configuration (console handlers; file handlers are attached
+    # below through the queue so disk I/O stays off the hot path)
     config = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -54,78 +101,86 @@ def setup_logging(log_level: str = "INFO", log_file: str = None) -> None:
                 "stream": "ext://sys.stdout",
             }
         },
-        "loggers": {},
+        "loggers": {"whisprmate": {"level": "DEBUG", "handlers": ["console"], "propagate": False}},
         "root": {"level": log_level, "handlers": ["console"]},
     }
 
-    # Add file handlers only if logs directory is writable
+    # Stop any listener from a previous setup_logging call so its
+    # buffered records flush and handlers close cleanly. This must happen
+    # before dictConfig: its handler-clearing pass closes the old
+    # MemoryHandler (detaching its target), so anything still sitting in
+    # the queue at that point would drain into a dead handler and be lost.
+    _stop_queue_listener()
+
+    logging.config.dictConfig(config)
+
+    # Attach file handlers behind a queue only if logs directory is writable
+    file_logging_enabled = False
     if logs_writable and log_file:
         try:
             # Test if we can write to the log file
             test_file = Path(log_file)
             test_file.touch()
 
-            config["handlers"]["file"] = {
-                "class": "logging.FileHandler",
-                "level": "DEBUG",
-                "formatter": "detailed",
-                "filename": str(log_file),
-                "mode": "a",
-                "encoding": "utf-8",
-            }
-
-            config["handlers"]["error_file"] = {
-                "class": "logging.FileHandler",
-                "level": "ERROR",
-                "formatter": "detailed",
-                "filename": str(logs_dir / "errors.log"),
-                "mode": "a",
-                "encoding": "utf-8",
-            }
-
-            # Update root and logger handlers to include file handlers
-            config["root"]["handlers"] = ["console", "file"]
-            file_handlers = ["console", "file", "error_file"]
-            simple_file_handlers = ["console", "file"]
+            detailed_formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+
+            file_handler = logging.FileHandler(str(log_file), mode="a", encoding="utf-8")
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(detailed_formatter)
+
+            # Batch main-log writes: records accumulate in memory and hit
+            # disk every 512 records, on any ERROR, or on the periodic flush
+            buffered_handler = MemoryHandler(
+                capacity=512, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+            )
+
+            error_handler = logging.FileHandler(
+                str(logs_dir / "errors.log"), mode="a", encoding="utf-8"
+            )
+            error_handler.setLevel(logging.ERROR)
+            error_handler.setFormatter(detailed_formatter)
+
+            # Log calls enqueue the record; the listener thread owns the
+            # actual file writes
+            log_queue = queue.Queue(-1)
+            queue_handler = QueueHandler(log_queue)
+            _queue_listener = QueueListener(
+                log_queue, buffered_handler, error_handler, respect_handler_level=True
+            )
+            _queue_listener.start()
+            _schedule_flush(buffered_handler)
+
+            logging.getLogger().addHandler(queue_handler)
+            logging.getLogger("whisprmate").addHandler(queue_handler)
+            file_logging_enabled = True
 
         except (PermissionError, OSError) as e:
             print(f"Warning: Cannot write to log files: {e}")
             print("Using console-only logging")
-            file_handlers = ["console"]
-            simple_file_handlers = ["console"]
-    else:
-        file_handlers = ["console"]
-        simple_file_handlers = ["console"]
-
-    # Configure application loggers
-    config["loggers"] = {
-        "whisprmate": {"level": "DEBUG", "handlers": file_handlers, "propagate": False},
-        "whisprmate.audio": {
-            "level": "DEBUG",
-            "handlers": simple_file_handlers,
-            "propagate": False,
-        },
-        "whisprmate.auth": {"level": "DEBUG", "handlers": simple_file_handlers, "propagate": False},
-        "whisprmate.file": {"level": "DEBUG", "handlers": simple_file_handlers, "propagate": False},
-        "whisprmate.transcript": {
-            "level": "DEBUG",
-            "handlers": simple_file_handlers,
-            "propagate": False,
-        },
-    }
-
-    logging.config.dictConfig(config)
 
-    # Log startup message
+    # Log startup message as one record: a single handler traversal and
+    # write instead of six
     logger = logging.getLogger("whisprmate")
-    logger.info("=" * 60)
-    logger.info("WhisprMate Application Starting")
-    logger.info(f"Log Level: {log_level}")
-    logger.info(f"Log File: {log_file if log_file else 'Console only'}")
-    logger.info(f"Environment: {os.getenv('ENVIRONMENT', 'development')}")
+    logger.info(
+        "\n".join(
+            [
+                "=" * 60,
+                "WhisprMate Application Starting",
+                "Log Level: %s",
+                "Log File: %s",
+                "Environment: %s",
+                "=" * 60,
+            ]
+        ),
+        log_level,
+        log_file if file_logging_enabled else "Console only",
+        os.getenv("ENVIRONMENT", "development"),
+    )
     if not logs_writable:
         logger.warning("File logging disabled due to permissions - using console only")
-    logger.info("=" * 60)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -1,5 +1,6 @@
 """Application configuration settings."""
 
+import functools
 import os
 from pathlib import Path
 from typing import List
@@ -16,6 +17,8 @@ class AppConfig:
     _DEFAULT_UPLOAD_DIR: Path = Path("uploads")
     MAX_FILE_SIZE_MB: int = 50
     SUPPORTED_FORMATS: List[str] = ["wav", "mp3"]
+    # Tuple form so is_supported_format can use a single endswith() call
+    _SUPPORTED_SUFFIXES: tuple = tuple(f".{fmt}" for fmt in SUPPORTED_FORMATS)
 
     # Processing settings
     DEFAULT_MODEL_SIZE: str = "base"
@@ -34,6 +37,10 @@ class AppConfig:
     def get_upload_dir(cls) -> Path:
         """Get upload directory path from environment variable or default.
 
+        The resolution (env lookups + mkdir) is memoized, so only the
+        first call per process pays the syscalls; Streamlit reruns the
+        script on every widget interaction.
+
         Environment Variables:
             UPLOADS_DIR: Custom path for uploads directory
             UPLOADS_HOST_PATH: Host path for Docker volume mapping
@@ -41,36 +48,50 @@ class AppConfig:
         Returns:
             Path: Upload directory path
         """
-        # Check for custom uploads directory from environment
-        uploads_dir = os.getenv("UPLOADS_DIR")
-        if uploads_dir:
-            upload_path = Path(uploads_dir)
-            logger.info(f"Using custom uploads directory from UPLOADS_DIR: {upload_path}")
-        else:
-            # Check for host path mapping (useful for Docker)
-            host_path = os.getenv("UPLOADS_HOST_PATH")
-            if host_path:
-                upload_path = Path("/app/uploads")  # Container path
-                logger.info(f"Using Docker host path mapping: {host_path} -> {upload_path}")
-            else:
-                upload_path = cls._DEFAULT_UPLOAD_DIR
-                logger.debug(f"Using default uploads directory: {upload_path}")
-
-        # Create directory if it doesn't exist
-        upload_path.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Upload directory ensured: {upload_path}")
-
-        return upload_path
+        return _resolve_upload_dir()
 
     @classmethod
     def get_max_file_size_bytes(cls) -> int:
         """Get maximum file size in bytes."""
         return cls.MAX_FILE_SIZE_MB * 1024 * 1024
 
+    @classmethod
+    def reset_upload_dir_cache(cls) -> None:
+        """Drop the memoized upload directory so the next call re-resolves.
+
+        Only needed if UPLOADS_DIR / UPLOADS_HOST_PATH change at runtime.
+        """
+        _resolve_upload_dir.cache_clear()
+
     @classmethod
     def is_supported_format(cls, filename: str) -> bool:
         """Check if file format is supported."""
-        return any(filename.lower().endswith(f".{fmt}") for fmt in cls.SUPPORTED_FORMATS)
+        return filename.lower().endswith(cls._SUPPORTED_SUFFIXES)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_upload_dir() -> Path:
+    """Resolve and create the upload directory (cached per process)."""
+    # Check for custom uploads directory from environment
+    uploads_dir = os.getenv("UPLOADS_DIR")
+    if uploads_dir:
+        upload_path = Path(uploads_dir)
+        logger.info("Using custom uploads directory from UPLOADS_DIR: %s", upload_path)
+    else:
+        # Check for host path mapping (useful for Docker)
+        host_path = os.getenv("UPLOADS_HOST_PATH")
+        if host_path:
+            upload_path = Path("/app/uploads")  # Container path
+            logger.info("Using Docker host path mapping: %s -> %s", host_path, upload_path)
+        else:
+            upload_path = AppConfig._DEFAULT_UPLOAD_DIR
+            logger.debug("Using default uploads directory: %s", upload_path)
+
+    # Create directory if it doesn't exist
+    upload_path.mkdir(parents=True, exist_ok=True)
+    logger.debug("Upload directory ensured: %s", upload_path)
+
+    return upload_path
 
 
 class UIConfig:
@@ -125,6 +146,19 @@ class UIConfig:
         </style>
     """
 
+    MAIN_HEADER_HTML = """
+        <div class="main-header">
+            <h1>🎙️ Speaker Diarization & Transcription</h1>
+            <p>
+               Upload audio files and get AI-powered transcriptions with
+               speaker identification
+            </p>
+        </div>
+    """
+
+    # CSS and header shipped as one markdown element per rerun instead of two
+    MAIN_HEADER_BLOCK = MAIN_HEADER_CSS + MAIN_HEADER_HTML
+
     MENU_ITEMS = {
         "Get Help": "https://github.com/your-repo/issues",
         "Report a bug": "https://github.com/your-repo/issues",
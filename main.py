@@ -1,25 +1,213 @@
 """Main application entry point using refactored architecture."""
 
 import argparse
+import hashlib
+import html
+import json
 import os
+import re
+import shutil
+from pathlib import Path
 
 import streamlit as st
 
 from config.logging_config import get_logger, setup_logging
 from config.settings import AppConfig, UIConfig
+from src.core.models import ProcessingOptions
 from src.services.audio_processor import AudioProcessorService
 from src.services.auth_service import AuthenticationService
 from src.services.file_manager import FileManagerService
+from src.services.job_executor import submit_job
 from src.services.transcript_manager import TranscriptManagerService
 from src.ui.components.auth import AuthComponent
 from src.ui.components.file_components import FileListComponent, FileUploadComponent
-from src.utils.helpers import filter_audio_files, sort_audio_files
+from src.utils.helpers import filter_audio_files, get_audio_mime_type, sort_audio_files
 
 # Initialize logging
 setup_logging(log_level=os.getenv("LOG_LEVEL", "INFO"), log_file=os.getenv("LOG_FILE"))
 logger = get_logger("main")
 
 
+# Compiled once at import; reused for every transcript render
+_SRT_RE = re.compile(
+    r"(\d+)\s+(\d{2}:\d{2}:\d{2},\d{3})\s-->\s+(\d{2}:\d{2}:\d{2},\d{3})\s+([\s\S]*?)(?=\n{2,}|$)"
+)
+_SPEAKER_RE = re.compile(r"^(SPEAKER_\d+):\s*")
+
+
+def _srt_time_to_seconds(srt_time: str) -> float:
+    """Convert an SRT timestamp (HH:MM:SS,mmm) to seconds."""
+    time_part, ms_part = srt_time.split(",")
+    h, m, s = map(int, time_part.split(":"))
+    return h * 3600 + m * 60 + s + int(ms_part) / 1000.0
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _parse_srt_groups(transcript: str) -> list:
+    """Parse SRT text into speaker-grouped player cues, once per transcript.
+
+    Both the SRT regex scan and the grouping of consecutive same-speaker
+    segments happen here; the player receives finished groups as JSON and
+    only renders them, so the browser does no parsing work at all.
+    """
+    groups = []
+    cue_index = 0
+    for match in _SRT_RE.finditer(transcript):
+        text = match.group(4).replace("\n", " ").strip()
+        speaker = "SPEAKER"
+        speaker_match = _SPEAKER_RE.match(text)
+        if speaker_match:
+            speaker = speaker_match.group(1)
+            text = text[speaker_match.end() :]
+
+        end = _srt_time_to_seconds(match.group(3))
+        if groups and groups[-1]["speaker"] == speaker:
+            group = groups[-1]
+            group["end"] = end
+            group["texts"].append(text)
+            group["originalIndices"].append(cue_index)
+        else:
+            groups.append(
+                {
+                    "speaker": speaker,
+                    "start": _srt_time_to_seconds(match.group(2)),
+                    "end": end,
+                    "texts": [text],
+                    "originalIndices": [cue_index],
+                }
+            )
+        cue_index += 1
+    return groups
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _render_transcript_html(transcript: str) -> str:
+    """Render the player's dialog divs server-side, once per transcript.
+
+    Speaker class, avatar label and formatted timestamp depend only on
+    the transcript, so they are baked into the HTML here; the browser
+    script is left with nothing to compute per group — it just attaches
+    click handlers and toggles the active class.
+    """
+    parts = []
+    for i, group in enumerate(_parse_srt_groups(transcript)):
+        speaker_num = "1" if group["speaker"].endswith("0") else "2"
+        mins, secs = divmod(int(group["start"]), 60)
+        texts = "".join(
+            f'<p style="margin: 0 0 8px 0; line-height: 1.4;">{html.escape(text)}</p>'
+            for text in group["texts"]
+        )
+        parts.append(
+            f'<div class="dialog speaker-{int(speaker_num) - 1}" id="group-{i}">'
+            f'<span class="timestamp">{mins:02d}:{secs:02d}</span>'
+            f'<div class="speaker-avatar">{speaker_num}</div>'
+            f'<div class="content">'
+            f'<div class="speaker-name">Speaker {speaker_num}</div>'
+            f'<div class="text">{texts}</div>'
+            f"</div></div>"
+        )
+    return "".join(parts)
+
+
+# Streamlit serves files under ./static at /app/static when
+# enableStaticServing is on (see .streamlit/config.toml)
+_STATIC_AUDIO_DIR = Path("static/audio")
+
+
+def _staged_digest(path: str, mtime: float, size: int) -> str:
+    """Digest naming a staged copy of one (path, mtime, size) source."""
+    return hashlib.md5(f"{path}:{mtime}:{size}".encode()).hexdigest()[:16]
+
+
+def _reclaim_stale_staged_audio(keep: str) -> None:
+    """Remove staged copies that no current upload hashes to.
+
+    Re-uploading or editing a file re-keys its staged name, orphaning the
+    previous entry; without a sweep those accumulate for the life of the
+    server. Digests for every current upload are recomputed from one
+    scandir pass, and anything in the staging directory outside that set
+    (except the entry just staged) is deleted. Best-effort: a failed
+    sweep never blocks playback.
+
+    Args:
+        keep: Name of the freshly staged entry, always preserved
+    """
+    expected = {keep.split(".")[0]}
+    try:
+        with os.scandir(AppConfig.get_upload_dir()) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                expected.add(_staged_digest(entry.path, stat.st_mtime, stat.st_size))
+    except OSError:
+        return
+
+    try:
+        with os.scandir(_STATIC_AUDIO_DIR) as entries:
+            stale = [entry.path for entry in entries if entry.name.split(".")[0] not in expected]
+    except OSError:
+        return
+
+    for path in stale:
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _stage_static_audio(path: str, mtime: float, size: int) -> str:
+    """Expose an audio file through static serving and return its URL.
+
+    A data-URI embed forced the browser to decode a base64 blob a third
+    larger than the audio before playback could start. Staging the file
+    under ./static (hardlink when possible, copy otherwise) lets the
+    <audio> element stream it with Range requests instead: playback and
+    seeking only fetch the byte ranges they need, and no copy of the
+    audio ever lives on the Python heap.
+
+    The staged name hashes (path, mtime, size), so replacing an upload
+    yields a fresh URL; entries the previous key staged are reclaimed by
+    the sweep below, which runs only on this cache-miss path.
+    """
+    source = Path(path)
+    staged = _STATIC_AUDIO_DIR / f"{_staged_digest(path, mtime, size)}{source.suffix.lower()}"
+
+    if not staged.exists():
+        _STATIC_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, staged)
+        except OSError:
+            shutil.copyfile(source, staged)
+        _reclaim_stale_staged_audio(staged.name)
+
+    return f"/app/static/audio/{staged.name}"
+
+
+@st.cache_resource(show_spinner=False)
+def _get_services(default_username: str, default_password: str) -> tuple:
+    """Construct the service layer once per process.
+
+    Streamlit re-runs the whole script (and so re-enters
+    WhisprMateApp.__init__) on every widget event; cache_resource keeps
+    one instance of each service alive instead of rebuilding them — and
+    re-running FileManagerService's directory/permission probes — per
+    rerun. cache_resource returns the objects themselves, uncopied, which
+    is what stateful services need.
+    """
+    logger.debug("Initializing services...")
+    auth_service = AuthenticationService(
+        enable_auth=True,  # Enable authentication for login form
+        default_username=default_username,
+        default_password=default_password,
+    )
+    file_manager = FileManagerService()
+    transcript_manager = TranscriptManagerService(upload_dir=file_manager.upload_dir)
+    audio_processor = AudioProcessorService()
+    return auth_service, file_manager, transcript_manager, audio_processor
+
+
 class WhisprMateApp:
     """Main application class following SOLID principles."""
 
@@ -31,18 +219,12 @@ class WhisprMateApp:
             default_password: Default password for authentication
         """
         logger.info("Initializing WhisprMateApp")
-        logger.debug(f"Default credentials: username={default_username}")
-
-        # Initialize services (Dependency Injection)
-        logger.debug("Initializing services...")
-        self.auth_service = AuthenticationService(
-            enable_auth=True,  # Enable authentication for login form
-            default_username=default_username,
-            default_password=default_password,
+        logger.debug("Default credentials: username=%s", default_username)
+
+        # Services come from the process-wide cache (Dependency Injection)
+        (self.auth_service, self.file_manager, self.transcript_manager, self.audio_processor) = (
+            _get_services(default_username, default_password)
         )
-        self.file_manager = FileManagerService()
-        self.transcript_manager = TranscriptManagerService()
-        self.audio_processor = AudioProcessorService()
 
         # Initialize UI components
         logger.debug("Initializing UI components...")
@@ -78,9 +260,6 @@ class WhisprMateApp:
         )
         logger.debug("Streamlit page configuration set")
 
-        # Apply custom CSS
-        st.markdown(UIConfig.MAIN_HEADER_CSS, unsafe_allow_html=True)
-
         # Ensure session state is properly initialized before auth check
         self._init_session_state()
 
@@ -97,7 +276,7 @@ class WhisprMateApp:
 
         # Handle navigation
         page = st.session_state.current_page
-        logger.debug(f"Current page: {page}")
+        logger.debug("Current page: %s", page)
         if page == "player":
             logger.info("Rendering player page")
             self._show_player_page()
@@ -119,22 +298,24 @@ class WhisprMateApp:
             self._show_processing_status()
 
     def _render_header(self) -> None:
-        """Render application header."""
-        st.markdown(
-            """
-            <div class="main-header">
-                <h1>🎙️ Speaker Diarization & Transcription</h1>
-                <p>
-                   Upload audio files and get AI-powered transcriptions with
-                   speaker identification
-                </p>
-            </div>
-        """,
-            unsafe_allow_html=True,
-        )
+        """Render the custom CSS and application header as one element.
+
+        Gating the CSS behind session_state would drop the styles on the
+        next rerun (Streamlit clears elements that are not re-emitted), so
+        the win here is shipping one markdown delta instead of two. The
+        header classes are only used on authenticated pages, so injecting
+        after the auth check also skips the payload on the login screen.
+        """
+        st.markdown(UIConfig.MAIN_HEADER_BLOCK, unsafe_allow_html=True)
 
+    @st.fragment
     def _show_dashboard(self) -> None:
-        """Display the main dashboard with file management."""
+        """Display the main dashboard with file management.
+
+        Runs as a fragment so search/sort interactions rerun only this
+        section instead of the whole script (including the other tabs'
+        directory scans).
+        """
         st.header("📊 My Audio Files")
 
         # Search and sort controls
@@ -169,6 +350,15 @@ class WhisprMateApp:
             if st.button("🚀 Start Processing", type="primary"):
                 self._process_audio_file(audio_file, model_size, language)
 
+        # Poll the background jobs from a self-rerunning fragment while
+        # the queue is busy; render drained results once it empties
+        if st.session_state.get("processing_jobs"):
+            self._render_processing_jobs()
+        else:
+            for job in st.session_state.pop("finished_jobs", []):
+                self._render_job_result(job)
+
+    @st.fragment
     def _show_processing_status(self) -> None:
         """Display processing status and system information."""
         st.header("⚙️ Processing Status")
@@ -184,6 +374,19 @@ class WhisprMateApp:
         with col3:
             st.metric("Available Storage", "15.2 GB", "-0.5 GB")
 
+        # In-flight background jobs
+        jobs = st.session_state.get("processing_jobs", [])
+        if jobs:
+            st.subheader("🔄 Active Jobs")
+            for job in jobs:
+                if job["future"].done():
+                    state = "finishing"
+                elif job["future"].running():
+                    state = f"running ({min(int(job['progress']['value'] * 100), 100)}%)"
+                else:
+                    state = "queued"
+                st.markdown(f"**{job['file'].name}** — {state}")
+
         # Processing queue
         st.subheader("📋 Processing Queue")
         self._show_processing_queue()
@@ -191,52 +394,71 @@ class WhisprMateApp:
     def _show_processing_queue(self) -> None:
         """Show current processing queue status."""
         files = self.file_manager.get_audio_files()
+        # Transcript presence comes from the same cached directory scan
+        # as the listing - one set lookup per file, no stat calls
+        transcribed_names = self.file_manager.get_transcribed_names()
         processing_files = []
         completed_files = []
 
         for file in files:
-            if self.transcript_manager.transcript_exists(file):
+            if file.name in transcribed_names:
                 completed_files.append(file)
             else:
                 processing_files.append(file)
 
+        # One st.markdown per group: each call is a separate message over
+        # the websocket, so N rows collapse into a single element
         if processing_files:
             st.warning(f"⏳ {len(processing_files)} files waiting to be processed")
-            for file in processing_files:
-                st.markdown(
+            st.markdown(
+                "".join(
                     f"""
                     <div style="padding: 10px; background: #fff3cd;
                                 border-radius: 5px; margin: 5px 0;">
                         <span class="status-indicator status-processing"></span>
-                        <strong>{file.name}</strong> - Waiting for processing
+                        <strong>{html.escape(file.name)}</strong> - Waiting for processing
                     </div>
-                """,
-                    unsafe_allow_html=True,
-                )
+                """
+                    for file in processing_files
+                ),
+                unsafe_allow_html=True,
+            )
 
         if completed_files:
             st.success(f"✅ {len(completed_files)} files processed successfully")
-            for file in completed_files:
-                st.markdown(
+            st.markdown(
+                "".join(
                     f"""
                     <div style="padding: 10px; background: #d4edda;
                                 border-radius: 5px; margin: 5px 0;">
                         <span class="status-indicator status-completed"></span>
-                        <strong>{file.name}</strong> - Processing completed
+                        <strong>{html.escape(file.name)}</strong> - Processing completed
                     </div>
-                """,
-                    unsafe_allow_html=True,
-                )
+                """
+                    for file in completed_files
+                ),
+                unsafe_allow_html=True,
+            )
 
         if not processing_files and not completed_files:
             st.info("📝 No files in queue. Upload files to get started!")
 
     def _process_audio_file(self, audio_file, model_size: str, language: str) -> None:
-        """Process audio file with given options."""
-        logger.info(f"Starting audio file processing: {audio_file.name}")
-        logger.debug(f"Processing parameters: model={model_size}, language={language}")
+        """Submit audio processing to the background executor.
+
+        The transcription itself runs on a worker thread; the script
+        thread only stores the future for the polling fragment, so the
+        session stays responsive to other widget events while files
+        process. The shared executor runs jobs FIFO, so several uploads
+        can be queued and are worked through in submission order.
+        """
+        jobs = st.session_state.setdefault("processing_jobs", [])
+        if any(job["file"].name == audio_file.name for job in jobs):
+            st.warning(f"⏳ {audio_file.name} is already queued for processing.")
+            return
 
-        from src.core.models import ProcessingOptions
+        logger.info("Starting audio file processing: %s", audio_file.name)
+        logger.debug("Processing parameters: model=%s, language=%s", model_size, language)
 
         # Create processing options
         options = ProcessingOptions(
@@ -248,61 +470,94 @@ class WhisprMateApp:
             estimated_time = self.audio_processor.estimate_processing_time(
                 audio_file.duration_seconds, options
             )
-            logger.info(f"Estimated processing time: {estimated_time:.0f} seconds")
+            logger.info("Estimated processing time: %.0f seconds", estimated_time)
             st.info(f"⏱️ Estimated processing time: {estimated_time:.0f} seconds")
 
-        # Process the file
-        logger.info("Starting audio processing...")
-        with st.spinner("🤖 Processing audio... This may take a few minutes."):
-            try:
-                # In a real async implementation, this would be await
-                # For now, we'll use a synchronous approach
-                import asyncio
-
-                result = asyncio.run(self.audio_processor.process_audio(audio_file, options))
-
-                if result.status.value == "completed":
-                    logger.info(f"Audio processing completed successfully for: {audio_file.name}")
-                    # Save transcript
-                    self.transcript_manager.save_transcript(audio_file, result)
-
-                    st.success("🎉 Processing complete!")
-                    st.balloons()
-
-                    # Show preview
-                    if result.srt_content:
-                        preview = result.srt_content[:500] + "..."
-                        st.subheader("📄 Transcript Preview")
-                        st.text_area(
-                            "Transcript Preview",
-                            preview,
-                            height=150,
-                            disabled=True,
-                            label_visibility="collapsed",
-                        )
-
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.download_button(
-                                "📄 Download Full Transcript",
-                                result.srt_content,
-                                file_name=f"{audio_file.name}.srt",
-                            )
-                        with col2:
-                            if st.button("▶️ Open Player"):
-                                logger.info(f"Opening player for: {audio_file.name}")
-                                st.session_state["player_file"] = audio_file.name
-                                st.session_state["current_page"] = "player"
-                                st.rerun()
-                else:
-                    logger.error(
-                        f"Audio processing failed for {audio_file.name}: {result.error_message}"
-                    )
-                    st.error(f"❌ Processing failed: {result.error_message}")
+        # The worker thread cannot touch Streamlit widgets, so progress is
+        # written into a shared dict the polling rerun reads
+        progress = {"value": 0.0}
+        future = submit_job(
+            self.audio_processor.process_audio(
+                audio_file, options, progress_cb=lambda p: progress.update(value=p)
+            )
+        )
+        jobs.append({"file": audio_file, "future": future, "progress": progress})
+        st.rerun()
+
+    @st.fragment(run_every=0.5)
+    def _render_processing_jobs(self) -> None:
+        """Poll the queued processing jobs and render their status.
+
+        Runs as a fragment with run_every, so the 0.5 s poll reruns only
+        this block and the rest of the page (including the status tab)
+        keeps rendering while jobs are in flight. Finished jobs move to
+        finished_jobs in submission order; once the queue drains, one
+        full rerun stops the poll and renders their results.
+        """
+        jobs = st.session_state.get("processing_jobs", [])
+        finished = st.session_state.setdefault("finished_jobs", [])
 
-            except Exception as e:
-                logger.exception(f"Unexpected error processing {audio_file.name}: {str(e)}")
-                st.error(f"❌ Processing error: {str(e)}")
+        while jobs and jobs[0]["future"].done():
+            finished.append(jobs.pop(0))
+
+        for job in jobs:
+            st.progress(
+                min(int(job["progress"]["value"] * 100), 100),
+                text=f"🤖 Processing {job['file'].name}... This may take a few minutes.",
+            )
+
+        if not jobs:
+            st.rerun(scope="app")
+
+    def _render_job_result(self, job: dict) -> None:
+        """Render the outcome of one finished processing job."""
+        audio_file = job["file"]
+
+        try:
+            result = job["future"].result()
+        except Exception as e:
+            logger.exception("Unexpected error processing %s: %s", audio_file.name, e)
+            st.error(f"❌ Processing error: {str(e)}")
+            return
+
+        if result.status.value == "completed":
+            logger.info("Audio processing completed successfully for: %s", audio_file.name)
+            # Save transcript
+            self.transcript_manager.save_transcript(audio_file, result)
+
+            st.success("🎉 Processing complete!")
+            st.balloons()
+
+            # Show preview
+            if result.srt_content:
+                preview = result.srt_content[:500] + "..."
+                st.subheader("📄 Transcript Preview")
+                st.text_area(
+                    "Transcript Preview",
+                    preview,
+                    height=150,
+                    disabled=True,
+                    label_visibility="collapsed",
+                )
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.download_button(
+                        "📄 Download Full Transcript",
+                        result.srt_content,
+                        file_name=f"{audio_file.name}.srt",
+                    )
+                with col2:
+                    if st.button("▶️ Open Player"):
+                        logger.info("Opening player for: %s", audio_file.name)
+                        st.session_state["player_file"] = audio_file.name
+                        st.session_state["current_page"] = "player"
+                        st.rerun()
+        else:
+            logger.error(
+                "Audio processing failed for %s: %s", audio_file.name, result.error_message
+            )
+            st.error(f"❌ Processing failed: {result.error_message}")
 
     def _show_player_page(self) -> None:
         """Display the enhanced audio player interface."""
@@ -329,8 +584,9 @@ class WhisprMateApp:
         with col2:
             st.title(f"🎵 {player_file}")
 
-        # Check if transcript exists
-        if self.transcript_manager.transcript_exists(audio_file):
+        # Transcript presence comes from the cached directory scan that
+        # the dashboard already populated - no extra stat per navigation
+        if audio_file.name in self.transcript_manager.existing_transcripts():
             transcript = self.transcript_manager.load_transcript(audio_file)
             if transcript:
                 # Create interactive audio player with transcript
@@ -348,25 +604,24 @@ class WhisprMateApp:
 
     def _render_interactive_player(self, audio_file, transcript: str) -> None:
         """Render the interactive audio player with transcript dialog."""
-        import base64
-
-        from src.utils.helpers import get_audio_mime_type
-
-        # Read and encode audio file
-        with open(audio_file.path, "rb") as f:
-            audio_bytes = f.read()
-
-        audio_base64 = base64.b64encode(audio_bytes).decode()
+        # Stage the file for static serving (cached across reruns)
+        audio_stat = audio_file.path.stat()
+        audio_url = _stage_static_audio(
+            str(audio_file.path), audio_stat.st_mtime, audio_stat.st_size
+        )
         audio_mime = get_audio_mime_type(audio_file.name)
 
-        # Escape transcript content for JavaScript
-        transcript_escaped = (
-            transcript.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        # Parse, group and render the transcript server-side; the script
+        # only receives the group time ranges it needs for highlighting,
+        # as compact [start, end] pairs rounded to 10 ms
+        transcript_html = _render_transcript_html(transcript)
+        cues_json = json.dumps(
+            [[round(g["start"], 2), round(g["end"], 2)] for g in _parse_srt_groups(transcript)],
+            separators=(",", ":"),
         )
 
         # Create the interactive player HTML
-        player_html = (
-            f"""
+        player_html = f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -403,6 +658,10 @@ class WhisprMateApp:
               padding: 12px 16px;
               gap: 12px;
               border-bottom: 1px solid #f0f0f0;
+              /* Skip layout/paint for off-screen dialogs; the estimated
+                 size keeps the scrollbar stable for long transcripts */
+              content-visibility: auto;
+              contain-intrinsic-size: auto 72px;
             }}
             .dialog:last-child {{
               border-bottom: none;
@@ -489,7 +748,7 @@ class WhisprMateApp:
         <body>
           <div class="player-container">
             <audio id="audio" controls preload="metadata">
-              <source src="data:{audio_mime};base64,{audio_base64}" type="{audio_mime}">
+              <source src="{audio_url}" type="{audio_mime}">
               Your browser does not support the audio element.
             </audio>
             <div class="progress-container">
@@ -498,95 +757,15 @@ class WhisprMateApp:
               <span class="time-display" id="total-time">00:00</span>
             </div>
           </div>
-          <div id="transcript"></div>
+          <div id="transcript">{transcript_html}</div>
           <script>
-            function parseSRT(data) {{
-              const srt = [];
-              const regex = /(\\d+)\\s+(\\d{{2}}:\\d{{2}}:\\d{{2}},\\d{{3}})\\s-->\\s+"""
-            + f"""(\\d{{2}}:\\d{{2}}:\\d{{2}},\\d{{3}})\\s+([\\s\\S]*?)(?=\\n{{2,}}|$)/g;
-              let match;
-              while ((match = regex.exec(data)) !== null) {{
-                let text = match[4].replace(/\\n/g, ' ');
-                let speaker = "SPEAKER";
-                const speakerMatch = text.match(/^(SPEAKER_\\d+):\\s*/);
-                if (speakerMatch) {{
-                  speaker = speakerMatch[1];
-                  text = text.replace(/^(SPEAKER_\\d+):\\s*/, "");
-                }}
-                srt.push({{
-                  index: parseInt(match[1]),
-                  start: toSeconds(match[2]),
-                  end: toSeconds(match[3]),
-                  speaker,
-                  text
-                }});
-              }}
-              return srt;
-            }}
-            function toSeconds(time) {{
-              const [h, m, s] = time.replace(',', ':').split(':').map(Number);
-              return h * 3600 + m * 60 + s;
-            }}
-
-            // Parse the transcript data
-            const srtText = "{transcript_escaped}";
-            const cues = parseSRT(srtText);
+            // Dialogs are rendered server-side; the script only needs the
+            // group times for highlighting and click-to-seek
+            const groupTimes = {cues_json};
             const transcriptDiv = document.getElementById('transcript');
 
-            // Group consecutive segments by speaker
-            const groupedCues = [];
-            let currentGroup = null;
-
-            cues.forEach((cue, i) => {{
-              if (!currentGroup || currentGroup.speaker !== cue.speaker) {{
-                // Start a new group
-                currentGroup = {{
-                  speaker: cue.speaker,
-                  start: cue.start,
-                  end: cue.end,
-                  texts: [cue.text],
-                  originalIndices: [i]
-                }};
-                groupedCues.push(currentGroup);
-              }} else {{
-                // Add to existing group
-                currentGroup.end = cue.end;
-                currentGroup.texts.push(cue.text);
-                currentGroup.originalIndices.push(i);
-              }}
-            }});
-
-            // Render grouped dialogs
-            groupedCues.forEach((group, groupIndex) => {{
-              const div = document.createElement('div');
-              div.className = 'dialog speaker-' + (group.speaker.endsWith("0") ? "0" : "1");
-              div.id = 'group-' + groupIndex;
-              div.dataset.originalIndices = group.originalIndices.join(',');
-
-              // Format time for display
-              const formatTime = (seconds) => {{
-                const mins = Math.floor(seconds / 60);
-                const secs = Math.floor(seconds % 60);
-                return `${{mins.toString().padStart(2, '0')}}:${{secs.toString().padStart(2, '0')}}`;
-              }};
-
-              // Determine speaker number and name
-              const speakerNum = group.speaker.endsWith("0") ? "1" : "2";
-              const speakerName = `Speaker ${{speakerNum}}`;
-
-              // Combine texts with paragraph breaks
-              const combinedText = group.texts.map(text => `<p style="margin: 0 0 8px 0; line-height: 1.4;">${{text}}</p>`).join('');
-
-              div.innerHTML = `
-                <span class="timestamp">${{formatTime(group.start)}}</span>
-                <div class="speaker-avatar">${{speakerNum}}</div>
-                <div class="content">
-                  <div class="speaker-name">${{speakerName}}</div>
-                  <div class="text">${{combinedText}}</div>
-                </div>
-              `;
-              transcriptDiv.appendChild(div);
-            }});
+            // Cache group nodes once instead of getElementById per tick
+            const groupNodes = Array.from(transcriptDiv.children);
 
             // Audio time update handler
             const audio = document.getElementById('audio');
@@ -620,45 +799,80 @@ class WhisprMateApp:
               }}, 3000);
             }});
             
-            audio.ontimeupdate = () => {{
+            let activeGroup = -1;
+            let lastTick = -1;
+
+            const updateHighlight = () => {{
+              // Debounce: skip ticks that moved less than 100 ms
+              const t = audio.currentTime;
+              if (Math.abs(t - lastTick) < 0.1) return;
+              lastTick = t;
+
               // Update time display
-              currentTimeDisplay.textContent = formatTimeDisplay(audio.currentTime);
-              
-              // Update active transcript segment
-              groupedCues.forEach((group, groupIndex) => {{
-                const div = document.getElementById('group-' + groupIndex);
-                if (audio.currentTime >= group.start && audio.currentTime <= group.end) {{
+              currentTimeDisplay.textContent = formatTimeDisplay(t);
+
+              // Groups are sorted by start time: binary-search the active
+              // one instead of scanning and touching every node per tick
+              let lo = 0, hi = groupTimes.length - 1, idx = -1;
+              while (lo <= hi) {{
+                const mid = (lo + hi) >> 1;
+                if (t < groupTimes[mid][0]) {{
+                  hi = mid - 1;
+                }} else if (t > groupTimes[mid][1]) {{
+                  lo = mid + 1;
+                }} else {{
+                  idx = mid;
+                  break;
+                }}
+              }}
+
+              if (idx !== activeGroup) {{
+                if (activeGroup >= 0) {{
+                  groupNodes[activeGroup].classList.remove('active');
+                }}
+                if (idx >= 0) {{
+                  const div = groupNodes[idx];
                   div.classList.add('active');
-                  
+
                   // Only auto-scroll if user is not manually scrolling
                   // and this is a new active element
                   if (!userIsScrolling && div !== lastActiveElement) {{
-                    div.scrollIntoView({{ 
-                      block: 'nearest', 
+                    div.scrollIntoView({{
+                      block: 'nearest',
                       behavior: 'smooth',
                       inline: 'nearest'
                     }});
                     lastActiveElement = div;
                   }}
-                }} else {{
-                  div.classList.remove('active');
                 }}
-              }});
+                activeGroup = idx;
+              }}
             }};
-            
+
+            // Coalesce timeupdate bursts onto animation frames and do
+            // nothing at all while the tab is hidden
+            let highlightQueued = false;
+            audio.addEventListener('timeupdate', () => {{
+              if (highlightQueued || document.hidden) return;
+              highlightQueued = true;
+              requestAnimationFrame(() => {{
+                highlightQueued = false;
+                updateHighlight();
+              }});
+            }});
+
             // Click to seek functionality for grouped dialogs
-            groupedCues.forEach((group, groupIndex) => {{
-              const div = document.getElementById('group-' + groupIndex);
+            groupTimes.forEach((group, groupIndex) => {{
+              const div = groupNodes[groupIndex];
               div.style.cursor = 'pointer';
               div.addEventListener('click', () => {{
-                audio.currentTime = group.start;
+                audio.currentTime = group[0];
               }});
             }});
           </script>
         </body>
         </html>
         """
-        )
 
         # Display the interactive player
         st.components.v1.html(player_html, height=700, scrolling=True)
@@ -677,7 +891,7 @@ def main():
     )
 
     args = parser.parse_args()
-    logger.info(f"Starting app with username: {args.username}")
+    logger.info("Starting app with username: %s", args.username)
 
     try:
         # Use environment variables if set, otherwise fallback to CLI args or defaults
@@ -686,7 +900,7 @@ def main():
         app = WhisprMateApp(default_username=username, default_password=password)
         app.run()
     except Exception as e:
-        logger.exception(f"Fatal error in main application: {str(e)}")
+        logger.exception("Fatal error in main application: %s", e)
         raise
 
 
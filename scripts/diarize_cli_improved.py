@@ -1,151 +1,363 @@
 import argparse
+import bisect
+import hashlib
+import json
 import os
 
-from dotenv import load_dotenv
+
+def _diarization_cache_path(audio_path):
+    """Cache file path for an audio file's diarization segments.
+
+    Keyed on size, mtime, and the first MiB of content so a renamed copy
+    still hits while any edit misses.
+    """
+    stat = os.stat(audio_path)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}:".encode())
+    with open(audio_path, "rb") as f:
+        digest.update(f.read(1 << 20))
+    cache_dir = os.path.join(os.path.expanduser("~"), ".whisprmate", "cache")
+    return os.path.join(cache_dir, f"{digest.hexdigest()}.diar.json")
+
+
+def _load_cached_segments(cache_path):
+    """Return cached diarization segments, or None on a miss."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_segments(cache_path, segments):
+    """Persist diarization segments; best-effort, never fails the run."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(segments, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
 
 def simulate_speaker_diarization(audio_file, segment_duration=10):
     """
     Simulate speaker diarization by creating alternating speaker segments
     """
+    import numpy as np
     import soundfile as sf
 
-    f = sf.SoundFile(audio_file)
-    total_duration = len(f) / f.samplerate
+    # sf.info parses the header without opening decoder state or
+    # holding a file descriptor
+    info = sf.info(audio_file)
+    total_duration = info.frames / info.samplerate
+
+    # One vectorized boundary computation instead of a dict-at-a-time
+    # while loop; speakers alternate between SPEAKER_00 and SPEAKER_01
+    starts = np.arange(0.0, total_duration, segment_duration)
+    speakers = ("SPEAKER_00", "SPEAKER_01")
+    return [
+        {
+            "start": float(start),
+            "end": float(min(start + segment_duration, total_duration)),
+            "speaker": speakers[i % 2],
+        }
+        for i, start in enumerate(starts)
+    ]
+
+
+def build_segments(
+    audio_path,
+    simulate=False,
+    no_diarization=False,
+    pipeline=None,
+    segment_duration=10,
+    min_diarization_sec=0.0,
+):
+    """
+    Build speaker segments for an audio file.
+
+    Dispatches to simulated diarization, a (pre-loaded) pyannote pipeline,
+    or a single whole-file segment when diarization is disabled. Files
+    shorter than min_diarization_sec skip the pipeline entirely — clips
+    that short almost never have a second speaker, and the pipeline run
+    costs far more than the transcription itself.
+    """
+    if simulate:
+        return simulate_speaker_diarization(audio_path, segment_duration)
+
+    import soundfile as sf
+
+    duration = sf.info(audio_path).duration
+
+    if not no_diarization and duration >= min_diarization_sec:
+        cache_path = _diarization_cache_path(audio_path)
+        segments = _load_cached_segments(cache_path)
+        if segments is not None:
+            return segments
+        if pipeline is not None:
+            diarization = pipeline(audio_path)
+            segments = []
+            for turn, _, speaker in diarization.itertracks(yield_label=True):
+                segments.append({"start": turn.start, "end": turn.end, "speaker": speaker})
+            _store_cached_segments(cache_path, segments)
+            return segments
+
+    # No (or skipped) diarization: treat the whole file as one segment
+    return [{"start": 0, "end": duration, "speaker": "SPEAKER_00"}]
+
+
+def transcribe_segments(model, audio_path, segments, language=None, progress_cb=None):
+    """
+    Transcribe each speaker segment with an already-loaded Whisper model.
+
+    Returns a list of SRT entry dicts; progress_cb (if given) receives
+    the per-file fraction completed in [0.0, 1.0].
+    """
+    import soundfile as sf
+
+    srt_entries = []
+    idx = 1
+    # Seek and read each segment directly from the file instead of
+    # materializing the whole decoded PCM up front: memory stays
+    # O(longest segment) and the full-length float64 -> float32 copy
+    # per slice goes away (the reads decode straight to float32)
+    with sf.SoundFile(audio_path) as audio_in:
+        sample_rate = audio_in.samplerate
+        for seg_num, seg in enumerate(segments):
+            if progress_cb is not None:
+                progress_cb(seg_num / len(segments))
+
+            start_sample = int(seg["start"] * sample_rate)
+            end_sample = int(seg["end"] * sample_rate)
+            audio_in.seek(start_sample)
+            segment_audio = audio_in.read(
+                frames=end_sample - start_sample, dtype="float32", always_2d=False
+            )
+
+            # Transcribe the segment
+            result = model.transcribe(
+                segment_audio,
+                language=language,
+                task="transcribe",
+                verbose=False,
+                fp16=False,
+                temperature=0,
+            )
+            text = result["text"].strip()
+            if text:
+                srt_entries.append(
+                    {
+                        "index": idx,
+                        "start": seg["start"],
+                        "end": seg["end"],
+                        "speaker": seg["speaker"],
+                        "text": f"{seg['speaker']}: {text}",
+                    }
+                )
+                idx += 1
+
+    return srt_entries
+
 
-    segments = []
-    current_time = 0
-    speaker_id = 0
+def transcribe_segments_batched(pipeline, audio_path, segments, language=None, progress_cb=None):
+    """
+    Transcribe all speaker segments in a single batched pass.
+
+    Hands the segment boundaries to faster-whisper's BatchedInferencePipeline
+    as clip timestamps so several segments share each forward pass instead of
+    paying encoder/decoder launch overhead once per speaker turn. Output
+    segments are mapped back to their speaker turn by midpoint, preserving
+    the one-SRT-entry-per-turn format of transcribe_segments().
+    """
+    clips = [{"start": seg["start"], "end": seg["end"]} for seg in segments]
+    result_iter, _info = pipeline.transcribe(
+        audio_path,
+        language=language,
+        task="transcribe",
+        temperature=0,
+        beam_size=1,
+        batch_size=16,
+        clip_timestamps=clips,
+    )
+
+    turn_starts = [seg["start"] for seg in segments]
+    total_duration = segments[-1]["end"] if segments else 0
+    turn_texts = [[] for _ in segments]
+    for out in result_iter:
+        if progress_cb is not None and total_duration:
+            progress_cb(min(out.end / total_duration, 1.0))
+        text = out.text.strip()
+        if not text:
+            continue
+        midpoint = (out.start + out.end) / 2
+        turn = max(bisect.bisect_right(turn_starts, midpoint) - 1, 0)
+        turn_texts[turn].append(text)
 
-    while current_time < total_duration:
-        end_time = min(current_time + segment_duration, total_duration)
-        segments.append(
+    srt_entries = []
+    idx = 1
+    for seg, texts in zip(segments, turn_texts):
+        if not texts:
+            continue
+        srt_entries.append(
             {
-                "start": current_time,
-                "end": end_time,
-                "speaker": f"SPEAKER_{speaker_id:02d}",
+                "index": idx,
+                "start": seg["start"],
+                "end": seg["end"],
+                "speaker": seg["speaker"],
+                "text": f"{seg['speaker']}: {' '.join(texts)}",
             }
         )
-        current_time = end_time
-        speaker_id = (speaker_id + 1) % 2  # Alternate between SPEAKER_00 and SPEAKER_01
+        idx += 1
+
+    return srt_entries
+
 
-    return segments
+def format_time(seconds):
+    """Format seconds as an SRT timestamp (HH:MM:SS,mmm)."""
+    h = int(seconds // 3600)
+    m = int((seconds % 3600) // 60)
+    s = int(seconds % 60)
+    ms = int((seconds - int(seconds)) * 1000)
+    return f"{h:02}:{m:02}:{s:02},{ms:03}"
+
+
+def write_srt(srt_entries, output):
+    """Write SRT entries to a file."""
+    # Build the whole document in memory and issue one write instead of
+    # three buffered writes per entry
+    content = "".join(
+        f"{entry['index']}\n"
+        f"{format_time(entry['start'])} --> {format_time(entry['end'])}\n"
+        f"{entry['text']}\n\n"
+        for entry in srt_entries
+    )
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(content)
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Diarize and transcribe audio to SRT with speaker labels."
     )
-    parser.add_argument("audio", help="Path to input audio file (wav/mp3)")
-    parser.add_argument("-o", "--output", default="output.srt", help="Output SRT file")
-    parser.add_argument(
-        "--model",
-        default="base",
-        help="Whisper model size (tiny, base, small, medium, large)",
-    )
+    parser.add_argument("audio", nargs="+", help="Path(s) to input audio file(s) (wav/mp3)")
     parser.add_argument(
-        "--language", default=None, help="Language code (e.g., en, hi, etc.)"
+        "-o",
+        "--output",
+        default=None,
+        help="Output SRT file (single input only; defaults to <audio>.srt)",
     )
     parser.add_argument(
-        "--no-diarization", action="store_true", help="Disable speaker diarization"
+        "--model", default="base", help="Whisper model size (tiny, base, small, medium, large)"
     )
+    parser.add_argument("--language", default=None, help="Language code (e.g., en, hi, etc.)")
+    parser.add_argument("--no-diarization", action="store_true", help="Disable speaker diarization")
     parser.add_argument(
         "--simulate-diarization",
         action="store_true",
         help="Simulate speaker diarization for testing",
     )
-    parser.add_argument(
-        "--hf-token", default=None, help="Hugging Face token for diarization"
-    )
+    parser.add_argument("--hf-token", default=None, help="Hugging Face token for diarization")
     parser.add_argument(
         "--segment-duration",
         type=int,
         default=10,
         help="Segment duration for simulated diarization (seconds)",
     )
+    parser.add_argument(
+        "--min-diarization-sec",
+        type=float,
+        default=5.0,
+        help="Skip diarization for files shorter than this (seconds)",
+    )
     args = parser.parse_args()
 
-    # Load .env if present
+    if args.output and len(args.audio) > 1:
+        parser.error("--output is only valid with a single input file")
+
+    # Load .env if present (imported here with the other heavy deps so
+    # --help and argument errors return without touching site-packages)
+    from dotenv import load_dotenv
+
     load_dotenv()
     hf_token = args.hf_token or os.getenv("HF_TOKEN")
 
-    if args.simulate_diarization:
-        # Use simulated diarization for testing
-        segments = simulate_speaker_diarization(args.audio, args.segment_duration)
-    elif not args.no_diarization:
-        from pyannote.audio import Pipeline
+    # Load models once up front so batch invocations amortize the
+    # model-load cost across all input files. Prefer faster-whisper's
+    # batched pipeline (one forward pass covers many speaker turns) and
+    # fall back to the reference whisper per-segment loop when it is
+    # not installed.
+    try:
+        from faster_whisper import BatchedInferencePipeline, WhisperModel
+    except ImportError:
+        WhisperModel = None
 
-        if not hf_token:
-            raise RuntimeError("Hugging Face token required for diarization.")
-        pipeline = Pipeline.from_pretrained(
-            "pyannote/speaker-diarization-3.1", use_auth_token=hf_token
-        )
-        diarization = pipeline(args.audio)
-        segments = []
-        for turn, _, speaker in diarization.itertracks(yield_label=True):
-            segments.append({"start": turn.start, "end": turn.end, "speaker": speaker})
+    if WhisperModel is not None:
+        # int8 quantization halves weight memory traffic; keep float16
+        # activations on GPU where the tensor cores want them
+        import ctranslate2
+
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        model = WhisperModel(args.model, device=device, compute_type=compute_type)
+        batched_pipeline = BatchedInferencePipeline(model=model)
     else:
-        # No diarization: treat the whole file as one segment
-        import soundfile as sf
+        import whisper
 
-        f = sf.SoundFile(args.audio)
-        duration = len(f) / f.samplerate
-        segments = [{"start": 0, "end": duration, "speaker": "SPEAKER_00"}]
+        model = whisper.load_model(args.model)
+        batched_pipeline = None
 
-    # Transcribe each segment with Whisper
-    import soundfile as sf
-    import whisper
+    diarization_pipeline = None
+    if not args.simulate_diarization and not args.no_diarization:
+        import soundfile as sf
 
-    model = whisper.load_model(args.model)
+        # Don't pay the pipeline load (and token requirement) if every
+        # input falls under the short-file threshold or already has
+        # cached diarization segments from a previous run
+        if any(
+            sf.info(p).duration >= args.min_diarization_sec
+            and _load_cached_segments(_diarization_cache_path(p)) is None
+            for p in args.audio
+        ):
+            from pyannote.audio import Pipeline
 
-    # Load the full audio file
-    audio_data, sample_rate = sf.read(args.audio)
+            if not hf_token:
+                raise RuntimeError("Hugging Face token required for diarization.")
+            diarization_pipeline = Pipeline.from_pretrained(
+                "pyannote/speaker-diarization-3.1", use_auth_token=hf_token
+            )
 
-    srt_entries = []
-    idx = 1
-    for seg in segments:
-        # Extract the segment from the audio
-        start_sample = int(seg["start"] * sample_rate)
-        end_sample = int(seg["end"] * sample_rate)
-        segment_audio = audio_data[start_sample:end_sample].astype("float32")
-
-        # Transcribe the segment
-        result = model.transcribe(
-            segment_audio,
-            language=args.language,
-            task="transcribe",
-            verbose=False,
-            fp16=False,
-            temperature=0,
+    total_files = len(args.audio)
+    for file_num, audio_path in enumerate(args.audio):
+        segments = build_segments(
+            audio_path,
+            simulate=args.simulate_diarization,
+            no_diarization=args.no_diarization,
+            pipeline=diarization_pipeline,
+            segment_duration=args.segment_duration,
+            min_diarization_sec=args.min_diarization_sec,
         )
-        text = result["text"].strip()
-        if text:
-            srt_entries.append(
-                {
-                    "index": idx,
-                    "start": seg["start"],
-                    "end": seg["end"],
-                    "speaker": seg["speaker"],
-                    "text": f"{seg['speaker']}: {text}",
-                }
+
+        def emit_progress(fraction, _file_num=file_num):
+            # Progress marker consumed by the app's progress bar
+            # (overall fraction across all files in the batch)
+            print(f"PROGRESS: {(_file_num + fraction) / total_files:.2f}", flush=True)
+
+        if batched_pipeline is not None:
+            srt_entries = transcribe_segments_batched(
+                batched_pipeline, audio_path, segments, args.language, progress_cb=emit_progress
+            )
+        else:
+            srt_entries = transcribe_segments(
+                model, audio_path, segments, args.language, progress_cb=emit_progress
             )
-            idx += 1
-
-    # Write SRT file
-    def format_time(seconds):
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        ms = int((seconds - int(seconds)) * 1000)
-        return f"{h:02}:{m:02}:{s:02},{ms:03}"
-
-    with open(args.output, "w", encoding="utf-8") as f:
-        for entry in srt_entries:
-            f.write(f"{entry['index']}\n")
-            f.write(f"{format_time(entry['start'])} --> {format_time(entry['end'])}\n")
-            f.write(f"{entry['text']}\n\n")
-
-    print(f"SRT with speaker labels written to {args.output}")
+
+        output = args.output or f"{audio_path}.srt"
+        write_srt(srt_entries, output)
+        print(f"SRT with speaker labels written to {output}")
+
+    print("PROGRESS: 1.00", flush=True)
 
 
 if __name__ == "__main__":
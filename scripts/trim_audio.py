@@ -7,25 +7,36 @@ It supports both FFmpeg and soundfile backends for audio processing.
 """
 
 import argparse
+import functools
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 from typing import Optional
 
 try:
+    import numpy as np
     import soundfile as sf
     HAS_SOUNDFILE = True
 except ImportError:
     HAS_SOUNDFILE = False
 
 
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg() -> bool:
-    """Check if FFmpeg is available in the system."""
+    """Check if FFmpeg is available in the system.
+
+    Cached: availability doesn't change within a run, and the subprocess
+    probe costs tens of milliseconds per call. A PATH lookup short-circuits
+    the spawn entirely when ffmpeg isn't installed.
+    """
+    if shutil.which("ffmpeg") is None:
+        return False
     try:
         subprocess.run(
-            ["ffmpeg", "-version"], 
-            capture_output=True, 
+            ["ffmpeg", "-version"],
+            capture_output=True,
             check=True,
             timeout=10
         )
@@ -59,25 +70,29 @@ def trim_with_ffmpeg(
         
         cmd = [
             "ffmpeg",
-            "-i", str(input_file),
+            # -ss before -i enables fast input seek: ffmpeg jumps to the
+            # nearest packet instead of demuxing from byte 0
             "-ss", str(start_seconds),
+            "-i", str(input_file),
             "-t", str(duration_seconds),
             "-c", "copy",  # Copy without re-encoding for speed
+            "-avoid_negative_ts", "make_zero",  # Keep copied timestamps sane after the seek
             "-y",  # Overwrite output file
             str(output_file)
         ]
         
         print(f"Running FFmpeg command: {' '.join(cmd)}")
-        
+
+        # Let FFmpeg's stderr stream straight to the console instead of
+        # buffering it all in memory; progress shows up as it happens
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
             timeout=300  # 5 minute timeout
         )
-        
+
         if result.returncode != 0:
-            print(f"FFmpeg error: {result.stderr}")
+            print(f"FFmpeg exited with status {result.returncode}")
             return False
             
         print(f"Successfully trimmed audio with FFmpeg")
@@ -110,36 +125,46 @@ def trim_with_soundfile(
         True if successful, False otherwise
     """
     try:
-        # Read audio file info
-        with sf.SoundFile(input_file) as f:
-            sample_rate = f.samplerate
-            channels = f.channels
-            total_frames = len(f)
+        with sf.SoundFile(input_file) as fin:
+            sample_rate = fin.samplerate
+            channels = fin.channels
+            total_frames = len(fin)
             total_duration = total_frames / sample_rate
-            
-        print(f"Input file info: {total_duration:.2f}s, {sample_rate}Hz, {channels} channels")
-        
-        # Calculate frame positions
-        start_frame = int(start_time * 60 * sample_rate)
-        duration_frames = int(duration_minutes * 60 * sample_rate)
-        
-        # Validate bounds
-        if start_frame >= total_frames:
-            print(f"Error: Start time ({start_time:.2f} min) exceeds file duration ({total_duration/60:.2f} min)")
-            return False
-            
-        end_frame = min(start_frame + duration_frames, total_frames)
-        actual_duration = (end_frame - start_frame) / sample_rate / 60
-        
-        print(f"Trimming from {start_time:.2f} min for {actual_duration:.2f} min")
-        
-        # Read and write audio data
-        with sf.SoundFile(input_file) as f:
-            f.seek(start_frame)
-            data = f.read(frames=end_frame - start_frame)
-            
-        sf.write(output_file, data, sample_rate)
-        
+
+            print(f"Input file info: {total_duration:.2f}s, {sample_rate}Hz, {channels} channels")
+
+            # Calculate frame positions
+            start_frame = int(start_time * 60 * sample_rate)
+            duration_frames = int(duration_minutes * 60 * sample_rate)
+
+            # Validate bounds
+            if start_frame >= total_frames:
+                print(f"Error: Start time ({start_time:.2f} min) exceeds file duration ({total_duration/60:.2f} min)")
+                return False
+
+            end_frame = min(start_frame + duration_frames, total_frames)
+            actual_duration = (end_frame - start_frame) / sample_rate / 60
+
+            print(f"Trimming from {start_time:.2f} min for {actual_duration:.2f} min")
+
+            # Stream fixed-size blocks through one reused buffer instead of
+            # materializing the whole trimmed region in RAM; blocks(out=...)
+            # yields views into the same memory every iteration, so peak
+            # usage stays at one block regardless of trim length
+            fin.seek(start_frame)
+            # blocks() takes its blocksize from the buffer length when
+            # out= is given
+            buf = np.empty((65536, channels), dtype="float32")
+            with sf.SoundFile(
+                output_file,
+                "w",
+                samplerate=sample_rate,
+                channels=channels,
+                subtype=fin.subtype,
+            ) as fout:
+                for block in fin.blocks(frames=end_frame - start_frame, out=buf):
+                    fout.write(block)
+
         print(f"Successfully trimmed audio with soundfile")
         return True
         
@@ -173,8 +198,10 @@ def generate_output_filename(input_file: Path, duration_minutes: float, start_ti
         output_name = f"{stem}_trimmed_{start_time:.1f}m-{duration_minutes:.1f}m{suffix}"
     else:
         output_name = f"{stem}_trimmed_{duration_minutes:.1f}m{suffix}"
-        
-    return input_file.parent / output_name
+
+    # with_name swaps the final component in place instead of re-parsing
+    # the parent and joining
+    return input_file.with_name(output_name)
 
 
 def main():
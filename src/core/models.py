@@ -4,8 +4,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 
 class ProcessingStatus(Enum):
@@ -35,26 +36,40 @@ class AudioFile:
     created_at: Optional[datetime] = None
     format: Optional[SupportedFormat] = None
 
-    @property
+    @cached_property
+    def name_lower(self) -> str:
+        """Lowercase name, computed once for search and sort keys."""
+        return self.name.lower()
+
+    @cached_property
+    def transcript_path(self) -> Path:
+        """Path of the adjacent SRT file, computed once per instance.
+
+        Every transcript operation needs this path; with_suffix re-parses
+        the name each call, so share one computation across them.
+        """
+        return self.path.with_suffix(self.path.suffix + ".srt")
+
+    @cached_property
     def size_mb(self) -> float:
-        """Get file size in MB."""
+        """Get file size in MB, computed once per instance."""
         return self.size_bytes / (1024 * 1024)
 
-    @property
+    @cached_property
     def size_kb(self) -> float:
-        """Get file size in KB."""
+        """Get file size in KB, computed once per instance."""
         return self.size_bytes / 1024
 
-    @property
+    @cached_property
     def formatted_size(self) -> str:
-        """Get formatted file size string."""
+        """Get formatted file size string, computed once per instance."""
         if self.size_mb >= 1:
             return f"{self.size_mb:.2f} MB"
         return f"{self.size_kb:.1f} KB"
 
-    @property
+    @cached_property
     def formatted_duration(self) -> str:
-        """Get formatted duration string."""
+        """Get formatted duration string, computed once per instance."""
         if self.duration_seconds is None:
             return "-"
         mins, secs = divmod(int(self.duration_seconds), 60)
@@ -81,6 +96,14 @@ class TranscriptionSegment:
     confidence: Optional[float] = None
 
 
+def _seconds_to_srt_time(seconds: float) -> str:
+    """Convert seconds to SRT time format."""
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    millisecs = int((secs % 1) * 1000)
+    return f"{int(hours):02d}:{int(minutes):02d}:{int(secs):02d},{millisecs:03d}"
+
+
 @dataclass
 class ProcessingResult:
     """Result of audio processing."""
@@ -94,24 +117,13 @@ class ProcessingResult:
     @property
     def srt_content(self) -> str:
         """Generate SRT content from segments."""
-        srt_lines = []
-        for i, segment in enumerate(self.segments, 1):
-            start_srt = self._seconds_to_srt_time(segment.start_time)
-            end_srt = self._seconds_to_srt_time(segment.end_time)
-
-            srt_lines.extend(
-                [str(i), f"{start_srt} --> {end_srt}", f"{segment.speaker_id}: {segment.text}", ""]
-            )
-        return "\n".join(srt_lines)
-
-    @staticmethod
-    def _seconds_to_srt_time(seconds: float) -> str:
-        """Convert seconds to SRT time format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        return "\n".join(
+            f"{i}\n"
+            f"{_seconds_to_srt_time(segment.start_time)} --> "
+            f"{_seconds_to_srt_time(segment.end_time)}\n"
+            f"{segment.speaker_id}: {segment.text}\n"
+            for i, segment in enumerate(self.segments, 1)
+        )
 
 
 # Abstract interfaces following Dependency Inversion Principle
@@ -122,7 +134,10 @@ class AudioProcessorInterface(ABC):
 
     @abstractmethod
     async def process_audio(
-        self, audio_file: AudioFile, options: ProcessingOptions
+        self,
+        audio_file: AudioFile,
+        options: ProcessingOptions,
+        progress_cb: Optional[Callable[[float], None]] = None,
     ) -> ProcessingResult:
         """Process audio file and return transcription result."""
         pass
@@ -177,6 +192,11 @@ class TranscriptManagerInterface(ABC):
         """Check if transcript exists for audio file."""
         pass
 
+    @abstractmethod
+    def existing_transcripts(self) -> "frozenset[str]":
+        """Get names of all audio files that have a transcript."""
+        pass
+
 
 class AuthenticationInterface(ABC):
     """Interface for authentication services."""
@@ -1,5 +1,8 @@
 """Authentication service implementation."""
 
+import secrets
+import uuid
+
 import streamlit as st
 
 from config.logging_config import get_logger
@@ -28,6 +31,9 @@ class AuthenticationService(AuthenticationInterface):
         self.enable_auth = enable_auth
         self.default_username = default_username
         self.default_password = default_password
+        # Pre-encoded for the constant-time comparison in login()
+        self._username_bytes = default_username.encode()
+        self._password_bytes = default_password.encode()
         logger.info(f"AuthenticationService initialized: enabled={enable_auth}")
         logger.debug(f"Authentication settings: enable_auth={enable_auth}")
 
@@ -41,10 +47,8 @@ class AuthenticationService(AuthenticationInterface):
         if "username" not in st.session_state:
             st.session_state.username = None
         if "session_id" not in st.session_state:
-            import uuid
-
             st.session_state.session_id = str(uuid.uuid4())
-            logger.debug(f"New session initialized: {st.session_state.session_id}")
+            logger.debug("New session initialized: %s", st.session_state.session_id)
 
     def is_authenticated(self) -> bool:
         """Check if user is authenticated.
@@ -55,17 +59,16 @@ class AuthenticationService(AuthenticationInterface):
         if not self.enable_auth:
             return True
 
-        # Ensure session state is initialized
-        self._init_session_state()
-
-        # Check authentication status
+        # Read-only check: the .get defaults cover a fresh session, so no
+        # need to seed session state here (login does that when it
+        # actually mutates it). This runs on every rerun, and the service
+        # is a shared singleton, so the flag can't be cached on self —
+        # session state is the per-user store.
         is_auth = st.session_state.get("authenticated", False)
         username = st.session_state.get("username")
 
         if is_auth and username:
-            logger.debug(
-                f"User {username} is authenticated (session: {st.session_state.get('session_id', 'unknown')})"
-            )
+            logger.debug("User %s is authenticated", username)
             return True
 
         logger.debug("User is not authenticated")
@@ -93,8 +96,12 @@ class AuthenticationService(AuthenticationInterface):
             st.session_state["username"] = username or "user"
             return True
 
-        # Check against default credentials
-        if username == self.default_username and password == self.default_password:
+        # Check against default credentials; compare_digest runs in time
+        # independent of where the strings diverge, so failures don't
+        # leak prefix length through response timing
+        if secrets.compare_digest(
+            username.encode(), self._username_bytes
+        ) and secrets.compare_digest(password.encode(), self._password_bytes):
             logger.info(f"Successful login for user: {username}")
             st.session_state["authenticated"] = True
             st.session_state["username"] = username
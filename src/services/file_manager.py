@@ -1,10 +1,15 @@
 """File management service implementation."""
 
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import soundfile as sf
+import streamlit as st
 
 from config.logging_config import get_logger
 from config.settings import AppConfig
@@ -13,6 +18,162 @@ from ..core.models import AudioFile, FileManagerInterface, SupportedFormat
 
 logger = get_logger("file")
 
+# Extension -> format; splitext + one dict lookup instead of lowercasing
+# the whole name and scanning it once per candidate suffix
+_EXT_FORMAT = {".wav": SupportedFormat.WAV, ".mp3": SupportedFormat.MP3}
+
+
+@st.cache_data(ttl="1h", max_entries=1024, show_spinner=False)
+def _cached_duration(path: str, mtime: float, size: int) -> Optional[float]:
+    """Probe audio duration, cached on (path, mtime, size).
+
+    Keyed on the file's stat metadata so Streamlit reruns (search, sort,
+    filter) don't reopen every audio file, while replacing a file on disk
+    invalidates its cache entry naturally.
+
+    Args:
+        path: Path to audio file as string (cache keys must be hashable)
+        mtime: File modification time from os.stat
+        size: File size in bytes from os.stat
+
+    Returns:
+        Duration in seconds or None if unable to determine
+    """
+    try:
+        info = sf.info(path)
+        return info.frames / info.samplerate
+    except Exception:
+        return None
+
+
+@st.cache_data(ttl="1h", max_entries=1024, show_spinner=False)
+def _cached_content_digest(path: str, mtime: float, size: int) -> str:
+    """Hash a file's content in 1 MB chunks, cached on (path, mtime, size).
+
+    Used to recognize re-uploads of byte-identical audio so their
+    existing transcript can be reused instead of re-running the pipeline.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _build_audio_file(name: str, path: str, stat: os.stat_result) -> Optional[AudioFile]:
+    """Build an AudioFile from a scandir entry's name, path and stat.
+
+    Args:
+        name: File name within the upload directory
+        path: Full path to the file
+        stat: Stat result captured during the directory scan
+
+    Returns:
+        AudioFile instance, or None if the file can't be processed
+    """
+    try:
+        duration = _cached_duration(path, stat.st_mtime, stat.st_size)
+
+        file_format = _EXT_FORMAT.get(os.path.splitext(name)[1].lower())
+
+        return AudioFile(
+            name=name,
+            path=Path(path),
+            size_bytes=stat.st_size,
+            duration_seconds=duration,
+            created_at=datetime.fromtimestamp(stat.st_mtime),
+            format=file_format,
+        )
+    except Exception:
+        # Skip files that can't be processed
+        return None
+
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _scan_uploads(upload_dir: str, dir_mtime_ns: int) -> Tuple[List[AudioFile], "frozenset[str]"]:
+    """Scan the upload directory once for audio files and transcripts.
+
+    Keyed on the directory's mtime, so any add/remove/rename (including
+    writes from outside this process) invalidates the entry with a single
+    stat at the call site; the TTL is only a backstop for in-place file
+    rewrites, which don't bump the directory mtime. Callers that change
+    the directory contents can still bust the cache via
+    ``_scan_uploads.clear()``.
+
+    Args:
+        upload_dir: Upload directory path as string (cache keys must be
+            hashable)
+        dir_mtime_ns: Directory modification time from os.stat
+
+    Returns:
+        Tuple of (audio file listing, set of audio names that have a
+        transcript)
+    """
+    candidates = []
+    transcribed_names = set()
+
+    # Single scandir pass: DirEntry caches stat results, so each file
+    # costs one syscall instead of separate size/mtime/is_file lookups,
+    # and transcript presence is collected without a stat per audio file.
+    with os.scandir(upload_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+
+            if entry.name.endswith(".srt"):
+                # "<audio name>.srt" -> "<audio name>"
+                transcribed_names.add(entry.name[: -len(".srt")])
+                continue
+
+            if not AppConfig.is_supported_format(entry.name):
+                continue
+
+            try:
+                candidates.append((entry.name, entry.path, entry.stat()))
+            except OSError:
+                continue
+
+    # The duration probes dominate a cold scan and are independent file
+    # I/O (libsndfile releases the GIL while reading headers), so fan
+    # them out across threads; small listings stay serial since thread
+    # startup would cost more than it saves.
+    if len(candidates) < 4:
+        audio_files = [_build_audio_file(*candidate) for candidate in candidates]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+            audio_files = list(
+                executor.map(lambda candidate: _build_audio_file(*candidate), candidates)
+            )
+
+    return [f for f in audio_files if f is not None], frozenset(transcribed_names)
+
+
+def scan_uploads(upload_dir: Path) -> Tuple[List[AudioFile], "frozenset[str]"]:
+    """Stat the upload directory and return its cached scan.
+
+    Args:
+        upload_dir: Upload directory path
+
+    Returns:
+        Tuple of (audio file listing, set of audio names that have a
+        transcript); empty if the directory doesn't exist
+    """
+    try:
+        dir_mtime_ns = upload_dir.stat().st_mtime_ns
+    except OSError:
+        return [], frozenset()
+
+    return _scan_uploads(str(upload_dir), dir_mtime_ns)
+
+
+def invalidate_listing_cache() -> None:
+    """Bust the cached upload-directory scan.
+
+    Call after anything outside FileManagerService changes the upload
+    directory contents (e.g. a transcript is written or removed).
+    """
+    _scan_uploads.clear()
+
 
 class FileManagerService(FileManagerInterface):
     """Service for managing audio files and uploads."""
@@ -98,25 +259,34 @@ class FileManagerService(FileManagerInterface):
         file_path = self.upload_dir / filename
 
         try:
-            # Save the file
+            # Stream to disk in 1 MB chunks instead of materializing the
+            # whole upload in memory via getbuffer(); hash the same pass
+            # so duplicate detection costs no extra read
+            content_digest = hashlib.blake2b(digest_size=16)
+            uploaded_file.seek(0)
             with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
+                while block := uploaded_file.read(1 << 20):
+                    content_digest.update(block)
+                    f.write(block)
             logger.info(f"Successfully saved file: {filename}")
         except (PermissionError, OSError) as e:
             logger.error(f"Failed to save file {filename}: {e}")
             raise Exception(f"Error uploading file: {e}")
 
-        # Get file metadata
-        size_bytes = file_path.stat().st_size
-        created_at = datetime.fromtimestamp(file_path.stat().st_mtime)
-        duration = self.get_file_duration(file_path)
+        # Byte-identical re-upload of an already-transcribed file: copy the
+        # existing transcript instead of re-running the pipeline
+        self._reuse_duplicate_transcript(file_path, content_digest.hexdigest())
 
-        # Determine format
-        file_format = None
-        if filename.lower().endswith(".wav"):
-            file_format = SupportedFormat.WAV
-        elif filename.lower().endswith(".mp3"):
-            file_format = SupportedFormat.MP3
+        # Directory contents changed - bust the cached listing
+        _scan_uploads.clear()
+
+        # Get file metadata (one stat for size, mtime and the duration key)
+        stat = file_path.stat()
+        size_bytes = stat.st_size
+        created_at = datetime.fromtimestamp(stat.st_mtime)
+        duration = _cached_duration(str(file_path), stat.st_mtime, stat.st_size)
+
+        file_format = _EXT_FORMAT.get(os.path.splitext(filename)[1].lower())
 
         return AudioFile(
             name=filename,
@@ -127,46 +297,67 @@ class FileManagerService(FileManagerInterface):
             format=file_format,
         )
 
+    def _reuse_duplicate_transcript(self, file_path: Path, digest: str) -> None:
+        """Copy an existing transcript if the upload duplicates a file.
+
+        Candidates are pre-filtered by size before hashing, and hashes of
+        existing files are cached on their stat metadata, so the common
+        case (no duplicate) costs no file reads.
+
+        Args:
+            file_path: Path the upload was just saved to
+            digest: blake2b content digest of the uploaded bytes
+        """
+        try:
+            size = file_path.stat().st_size
+            files, transcribed = scan_uploads(self.upload_dir)
+            for other in files:
+                if (
+                    other.path == file_path
+                    or other.name not in transcribed
+                    or other.size_bytes != size
+                ):
+                    continue
+                other_stat = other.path.stat()
+                other_digest = _cached_content_digest(
+                    str(other.path), other_stat.st_mtime, other_stat.st_size
+                )
+                if other_digest == digest:
+                    shutil.copyfile(
+                        other.transcript_path,
+                        file_path.with_suffix(file_path.suffix + ".srt"),
+                    )
+                    logger.info(
+                        f"Reused transcript from byte-identical file: {other.name}"
+                    )
+                    return
+        except Exception:
+            # Duplicate detection is best-effort; never fail the upload
+            logger.debug("Duplicate-transcript check failed", exc_info=True)
+
     def get_audio_files(self) -> List[AudioFile]:
         """Get list of all audio files.
 
+        The listing is cached on the directory's mtime so Streamlit reruns
+        (every search keystroke, sort change) cost one stat instead of a
+        rescan; uploads and deletes also invalidate the cache explicitly.
+
         Returns:
             List of AudioFile instances
         """
-        audio_files = []
+        return scan_uploads(self.upload_dir)[0]
 
-        if not self.upload_dir.exists():
-            return audio_files
+    def get_transcribed_names(self) -> "frozenset[str]":
+        """Get names of audio files that have a transcript on disk.
 
-        for file_path in self.upload_dir.iterdir():
-            if file_path.is_file() and AppConfig.is_supported_format(file_path.name):
-                try:
-                    size_bytes = file_path.stat().st_size
-                    created_at = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    duration = self.get_file_duration(file_path)
-
-                    # Determine format
-                    file_format = None
-                    if file_path.name.lower().endswith(".wav"):
-                        file_format = SupportedFormat.WAV
-                    elif file_path.name.lower().endswith(".mp3"):
-                        file_format = SupportedFormat.MP3
-
-                    audio_file = AudioFile(
-                        name=file_path.name,
-                        path=file_path,
-                        size_bytes=size_bytes,
-                        duration_seconds=duration,
-                        created_at=created_at,
-                        format=file_format,
-                    )
-                    audio_files.append(audio_file)
-
-                except Exception:
-                    # Skip files that can't be processed
-                    continue
+        Collected in the same cached scandir pass as the file listing,
+        so checking transcript presence for N files is N set lookups
+        instead of N stat syscalls.
 
-        return audio_files
+        Returns:
+            Set of audio file names with an adjacent .srt file
+        """
+        return scan_uploads(self.upload_dir)[1]
 
     def delete_file(self, audio_file: AudioFile) -> bool:
         """Delete audio file and associated files.
@@ -183,10 +374,13 @@ class FileManagerService(FileManagerInterface):
                 audio_file.path.unlink()
 
             # Delete associated SRT file if it exists
-            srt_path = audio_file.path.with_suffix(audio_file.path.suffix + ".srt")
+            srt_path = audio_file.transcript_path
             if srt_path.exists():
                 srt_path.unlink()
 
+            # Directory contents changed - bust the cached listing
+            _scan_uploads.clear()
+
             return True
 
         except Exception:
@@ -202,11 +396,12 @@ class FileManagerService(FileManagerInterface):
             Duration in seconds or None if unable to determine
         """
         try:
-            with sf.SoundFile(str(file_path)) as f:
-                return len(f) / f.samplerate
-        except Exception:
+            stat = file_path.stat()
+        except OSError:
             return None
 
+        return _cached_duration(str(file_path), stat.st_mtime, stat.st_size)
+
     def file_exists(self, filename: str) -> bool:
         """Check if file exists in upload directory.
 
@@ -227,30 +422,37 @@ class FileManagerService(FileManagerInterface):
         Returns:
             Path for transcript file
         """
-        return audio_file.path.with_suffix(audio_file.path.suffix + ".srt")
+        return audio_file.transcript_path
 
     def cleanup_orphaned_files(self) -> int:
         """Clean up orphaned transcript files.
 
+        One scandir pass collects every name, so orphan detection is a
+        set lookup per transcript instead of an exists() stat per file
+        (and the pattern-match pass glob() made over the directory).
+
         Returns:
             Number of files cleaned up
         """
         cleaned = 0
 
-        if not self.upload_dir.exists():
+        try:
+            with os.scandir(self.upload_dir) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
             return cleaned
 
-        # Find SRT files without corresponding audio files
-        for file_path in self.upload_dir.glob("*.srt"):
-            # Check if original audio file exists
-            audio_name = file_path.name.replace(".srt", "")
-            audio_path = self.upload_dir / audio_name
-
-            if not audio_path.exists():
-                try:
-                    file_path.unlink()
-                    cleaned += 1
-                except Exception:
-                    continue
+        for name in names:
+            # "<audio name>.srt" is orphaned when "<audio name>" is gone
+            if not name.endswith(".srt") or name[: -len(".srt")] in names:
+                continue
+            try:
+                (self.upload_dir / name).unlink()
+                cleaned += 1
+            except Exception:
+                continue
+
+        if cleaned:
+            _scan_uploads.clear()
 
         return cleaned
@@ -0,0 +1,45 @@
+"""Background job execution shared across Streamlit reruns."""
+
+import asyncio
+import concurrent.futures
+import threading
+
+# This lives in an imported module on purpose: Streamlit execs the entry
+# script into a fresh module on every rerun, so an executor defined there
+# would be rebuilt per rerun and every submitted job would land on its
+# own pool. Imported modules survive reruns via sys.modules, so this one
+# executor (and its two worker threads) serves the whole process.
+
+# Transcription jobs run here so the Streamlit script thread stays free
+# to handle widget events while a file is being processed; two workers
+# bound concurrent Whisper/diarization runs, and queued jobs drain in
+# submission order.
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+# One event loop per worker thread, reused across jobs: asyncio.run would
+# build and tear down a loop (and lose anything cached on it) for every
+# submission. Thread-local keeps the two workers' loops independent, so
+# jobs still run in parallel.
+_WORKER_STATE = threading.local()
+
+
+def _run_job(coro):
+    """Drive a processing coroutine on this worker thread's own loop."""
+    loop = getattr(_WORKER_STATE, "loop", None)
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _WORKER_STATE.loop = loop
+    return loop.run_until_complete(coro)
+
+
+def submit_job(coro) -> concurrent.futures.Future:
+    """Queue a processing coroutine on the shared executor.
+
+    Args:
+        coro: Coroutine to drive on a worker thread
+
+    Returns:
+        Future resolving to the coroutine's result
+    """
+    return _EXECUTOR.submit(_run_job, coro)
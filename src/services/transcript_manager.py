@@ -3,16 +3,47 @@
 from pathlib import Path
 from typing import Optional
 
+import streamlit as st
+
 from config.logging_config import get_logger
+from config.settings import AppConfig
 
 from ..core.models import AudioFile, ProcessingResult, TranscriptManagerInterface
+from .file_manager import invalidate_listing_cache, scan_uploads
 
 logger = get_logger("transcript")
 
 
+@st.cache_data(max_entries=512, show_spinner=False)
+def _cached_transcript(path: str, mtime: float, size: int) -> Optional[str]:
+    """Read a transcript file, cached on (path, mtime, size).
+
+    The dashboard hands every row's transcript to a download button, so
+    without caching each rerun re-reads every SRT on disk. The mtime key
+    invalidates the entry when a transcript is rewritten.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except Exception:
+        return None
+
+
 class TranscriptManagerService(TranscriptManagerInterface):
     """Service for managing transcripts and SRT files."""
 
+    def __init__(self, upload_dir: Optional[Path] = None):
+        """Initialize the transcript manager service.
+
+        Args:
+            upload_dir: Directory holding the audio uploads (defaults to
+                config). Pass the file manager's actual directory so
+                scans look where uploads really land — it falls back to
+                alternative directories when the configured one isn't
+                writable.
+        """
+        self.upload_dir = upload_dir or AppConfig.get_upload_dir()
+
     def save_transcript(self, audio_file: AudioFile, result: ProcessingResult) -> Path:
         """Save transcript to file and return path.
 
@@ -23,7 +54,7 @@ class TranscriptManagerService(TranscriptManagerInterface):
         Returns:
             Path to saved transcript file
         """
-        srt_path = audio_file.path.with_suffix(audio_file.path.suffix + ".srt")
+        srt_path = audio_file.transcript_path
         logger.info(f"Saving transcript for {audio_file.name} to {srt_path}")
 
         try:
@@ -31,6 +62,7 @@ class TranscriptManagerService(TranscriptManagerInterface):
                 f.write(result.srt_content)
 
             logger.debug(f"Transcript saved successfully: {srt_path}")
+            invalidate_listing_cache()
             return srt_path
         except Exception as e:
             logger.error(f"Failed to save transcript to {srt_path}: {str(e)}")
@@ -45,17 +77,15 @@ class TranscriptManagerService(TranscriptManagerInterface):
         Returns:
             Transcript content or None if not found
         """
-        srt_path = audio_file.path.with_suffix(audio_file.path.suffix + ".srt")
-
-        if not srt_path.exists():
-            return None
+        srt_path = audio_file.transcript_path
 
         try:
-            with open(srt_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except Exception:
+            stat = srt_path.stat()
+        except OSError:
             return None
 
+        return _cached_transcript(str(srt_path), stat.st_mtime, stat.st_size)
+
     def transcript_exists(self, audio_file: AudioFile) -> bool:
         """Check if transcript exists for audio file.
 
@@ -65,9 +95,20 @@ class TranscriptManagerService(TranscriptManagerInterface):
         Returns:
             True if transcript exists
         """
-        srt_path = audio_file.path.with_suffix(audio_file.path.suffix + ".srt")
+        srt_path = audio_file.transcript_path
         return srt_path.exists()
 
+    def existing_transcripts(self) -> "frozenset[str]":
+        """Get the names of all audio files that have a transcript.
+
+        Backed by the cached upload-directory scan, so classifying a whole
+        listing costs set lookups instead of one stat syscall per file.
+
+        Returns:
+            Frozen set of audio file names with an SRT on disk
+        """
+        return scan_uploads(self.upload_dir)[1]
+
     def get_transcript_path(self, audio_file: AudioFile) -> Path:
         """Get transcript file path for audio file.
 
@@ -77,7 +118,7 @@ class TranscriptManagerService(TranscriptManagerInterface):
         Returns:
             Path to transcript file (may not exist)
         """
-        return audio_file.path.with_suffix(audio_file.path.suffix + ".srt")
+        return audio_file.transcript_path
 
     def delete_transcript(self, audio_file: AudioFile) -> bool:
         """Delete transcript file if it exists.
@@ -88,13 +129,14 @@ class TranscriptManagerService(TranscriptManagerInterface):
         Returns:
             True if deletion was successful or file didn't exist
         """
-        srt_path = audio_file.path.with_suffix(audio_file.path.suffix + ".srt")
+        srt_path = audio_file.transcript_path
 
         if not srt_path.exists():
             return True
 
         try:
             srt_path.unlink()
+            invalidate_listing_cache()
             return True
         except Exception:
             return False
@@ -1,12 +1,27 @@
 """File management UI components."""
 
+from datetime import datetime
 from typing import List
 
+import pandas as pd
 import streamlit as st
 
 from ...core.models import AudioFile
 from ...services.file_manager import FileManagerService
 from ...services.transcript_manager import TranscriptManagerService
+from ...utils.helpers import format_file_size
+
+
+@st.cache_data(max_entries=4096, show_spinner=False)
+def _format_created_date(ts: int) -> str:
+    """Format a file mtime for display, cached per whole second."""
+    return datetime.fromtimestamp(ts).strftime("%d/%m/%Y %H:%M")
+
+
+@st.cache_data(max_entries=4096, show_spinner=False)
+def _format_size(size_bytes: int) -> str:
+    """Format a file size for display, cached per byte count."""
+    return format_file_size(size_bytes)
 
 
 class FileListComponent:
@@ -27,6 +42,10 @@ class FileListComponent:
     def render_file_list(self, files: List[AudioFile]) -> None:
         """Render list of audio files.
 
+        A single st.dataframe replaces the per-row HTML card plus three
+        buttons: one widget and one serialized payload regardless of file
+        count, with actions driven by the table's row selection.
+
         Args:
             files: List of audio files to display
         """
@@ -34,8 +53,86 @@ class FileListComponent:
             st.info("📁 No audio files found. Upload your first file in the Upload tab!")
             return
 
-        for file in files:
-            self._render_file_card(file)
+        # One set from the cached directory scan; per-row presence checks
+        # become hash lookups instead of stat syscalls
+        transcribed_names = self.file_manager.get_transcribed_names()
+
+        table = pd.DataFrame(
+            {
+                "Name": [file.name for file in files],
+                "Created": [
+                    _format_created_date(int(file.created_at.timestamp()))
+                    if file.created_at
+                    else "-"
+                    for file in files
+                ],
+                "Duration": [file.formatted_duration for file in files],
+                "Size": [_format_size(file.size_bytes) for file in files],
+                "Transcript": ["✅" if file.name in transcribed_names else "⏳" for file in files],
+            }
+        )
+
+        # Key the widget on the listing order so a changed listing
+        # (search, sort, upload, delete) gets a fresh table with no
+        # selection - Streamlit persists selections across data changes,
+        # so a stale row index would otherwise point at whichever file
+        # now occupies that position
+        event = st.dataframe(
+            table,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"file_table_{hash(tuple(file.name for file in files))}",
+        )
+
+        # Belt and braces: never index past the listing even if a stale
+        # selection does survive
+        selected_rows = event.selection.rows
+        if not selected_rows or selected_rows[0] >= len(files):
+            st.caption("Select a file to play, download its transcript, or delete it.")
+            return
+
+        self._render_file_actions(files[selected_rows[0]], transcribed_names)
+
+    def _render_file_actions(self, file: AudioFile, transcribed_names: frozenset) -> None:
+        """Render action buttons for the selected file.
+
+        Args:
+            file: The selected audio file
+            transcribed_names: Audio file names that have a transcript
+        """
+        col1, col2, col3 = st.columns([1, 1, 1])
+
+        with col1:
+            if st.button("▶️ Play", key=f"play_{file.name}"):
+                st.session_state["player_file"] = file.name
+                st.session_state["current_page"] = "player"
+                st.rerun()
+
+        with col2:
+            transcript_content = (
+                self.transcript_manager.load_transcript(file)
+                if file.name in transcribed_names
+                else None
+            )
+            if transcript_content:
+                st.download_button(
+                    "📄 Download SRT",
+                    transcript_content,
+                    file_name=f"{file.name}.srt",
+                    key=f"download_{file.name}",
+                )
+            else:
+                st.button("❌ No transcript", disabled=True, key=f"no_transcript_{file.name}")
+
+        with col3:
+            if st.button("🗑️ Delete", key=f"delete_{file.name}"):
+                if self.file_manager.delete_file(file):
+                    st.success(f"Deleted {file.name}")
+                    st.rerun()
+                else:
+                    st.error(f"Error deleting {file.name}")
 
     def render_search_and_sort(self) -> tuple[str, str]:
         """Render search and sort controls.
@@ -63,69 +160,6 @@ class FileListComponent:
 
         return search_query, sort_option
 
-    def _render_file_card(self, file: AudioFile) -> None:
-        """Render individual file card.
-
-        Args:
-            file: Audio file to render
-        """
-        with st.container():
-            # File card HTML
-            created_date = file.created_at.strftime("%d/%m/%Y %H:%M") if file.created_at else "-"
-
-            st.markdown(
-                f"""
-                <div class="file-card">
-                    <div style="display: flex; justify-content: space-between;
-                                align-items: center;">
-                        <div>
-                            <h4 style="margin: 0; color: #333;">{file.name}</h4>
-                            <p style="margin: 5px 0; color: #666; font-size: 0.9em;">
-                                📅 {created_date} •
-                                ⏱️ {file.formatted_duration} •
-                                📦 {file.formatted_size}
-                            </p>
-                        </div>
-                    </div>
-                </div>
-            """,
-                unsafe_allow_html=True,
-            )
-
-            # Action buttons
-            col1, col2, col3 = st.columns([1, 1, 1])
-
-            with col1:
-                if st.button("▶️ Play", key=f"play_{file.name}"):
-                    st.session_state["player_file"] = file.name
-                    st.session_state["current_page"] = "player"
-                    st.rerun()
-
-            with col2:
-                if self.transcript_manager.transcript_exists(file):
-                    transcript_content = self.transcript_manager.load_transcript(file)
-                    if transcript_content:
-                        st.download_button(
-                            "📄 Download SRT",
-                            transcript_content,
-                            file_name=f"{file.name}.srt",
-                            key=f"download_{file.name}",
-                        )
-                    else:
-                        st.button(
-                            "❌ No transcript", disabled=True, key=f"no_transcript_{file.name}"
-                        )
-                else:
-                    st.button("❌ No transcript", disabled=True, key=f"no_transcript_{file.name}")
-
-            with col3:
-                if st.button("🗑️ Delete", key=f"delete_{file.name}"):
-                    if self.file_manager.delete_file(file):
-                        st.success(f"Deleted {file.name}")
-                        st.rerun()
-                    else:
-                        st.error(f"Error deleting {file.name}")
-
 
 class FileUploadComponent:
     """Component for file upload functionality."""
@@ -6,10 +6,27 @@ This module tests the AuthenticationService class independently.
 
 import sys
 import os
+import types
 
 # Add the project root to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+
+class _SessionState(dict):
+    """Dict with attribute access, mirroring st.session_state."""
+
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__
+
+
+# Stand-in installed before the service import: the real streamlit drags
+# in pandas/pyarrow/altair and dominates this test's cold start, and the
+# only API the auth service touches is session_state.
+_st_stub = types.ModuleType("streamlit")
+_st_stub.session_state = _SessionState()
+sys.modules["streamlit"] = _st_stub
+
 from src.services.auth_service import AuthenticationService
 
 
@@ -28,28 +45,10 @@ def test_authentication():
     print(f"Default password: {auth_service.default_password}")
     print(f"Authentication enabled: {auth_service.enable_auth}")
     
-    # Mock session state for testing (since we're not in Streamlit)
-    class MockSessionState:
-        def __init__(self):
-            self.data = {}
-        
-        def get(self, key, default=None):
-            return self.data.get(key, default)
-        
-        def __setitem__(self, key, value):
-            self.data[key] = value
-        
-        def __contains__(self, key):
-            return key in self.data
-        
-        def __delitem__(self, key):
-            if key in self.data:
-                del self.data[key]
-    
-    # Mock streamlit session state
-    import streamlit as st
-    st.session_state = MockSessionState()
-    
+    # Fresh session state so earlier runs can't leak into this one
+    _st_stub.session_state = _SessionState()
+
+
     # Test authentication
     print("\n--- Testing Authentication ---")
     